@@ -12,12 +12,21 @@ Output:
     Creates 'whitehouse_briefings.xml' in the current directory
 """
 
-import requests
-from bs4 import BeautifulSoup
-from feedgen.feed import FeedGenerator
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from selectolax.lexbor import LexborHTMLParser
+import lxml.html
+from lxml import etree
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import attrgetter
+from email.utils import format_datetime
+from xml.sax.saxutils import escape, quoteattr
 import re
 import os
+import json
+import functools
+import time
 import logging
 
 # Configure logging
@@ -26,6 +35,8 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO level
+logging.getLogger('httpx').setLevel(logging.WARNING)
 
 # Configuration
 CONFIG = {
@@ -41,251 +52,380 @@ CONFIG = {
     'logo_title': 'White House Briefings & Statements',
     'logo_link': 'https://www.whitehouse.gov/briefings-statements/',
     'logo_width': 144,  # RSS 2.0 max width
-    'logo_height': 144  # Adjust based on your logo aspect ratio
+    'logo_height': 144,  # Adjust based on your logo aspect ratio
+    'max_workers': 16,  # Concurrent article fetches
+    'cache_file': 'article_cache.json',  # ETag/Last-Modified + content per article URL
+    'revalidate_after_days': 7  # Re-check cached articles with a conditional GET after this long
 }
 
+MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+               'August', 'September', 'October', 'November', 'December']
+# Full and abbreviated (lowercase) month names to month numbers
+MONTHS = {
+    **{name.lower(): number for number, name in enumerate(MONTH_NAMES, 1)},
+    **{name[:3].lower(): number for number, name in enumerate(MONTH_NAMES, 1)},
+}
+
+# Date pattern like "November 14, 2025"
+DATE_RE = re.compile(rf'({"|".join(MONTH_NAMES)})\s+\d{{1,2}},\s+\d{{4}}')
+CONTENT_CLASS_RE = re.compile(r'content|entry|post', re.I)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Common patterns for White House article content, in order of preference
+CONTENT_XPATHS = [
+    etree.XPath(expr) for expr in [
+        '//article',
+        f'//*[{_has_class("entry-content")}]',
+        f'//*[{_has_class("post-content")}]',
+        f'//*[{_has_class("content")}]',
+        '//main',
+        '//*[@role="main"]',
+        f'//*[{_has_class("briefing-content")}]',
+        f'//*[{_has_class("statement-content")}]',
+    ]
+]
+STRIP_TAGS = ('script', 'style', 'nav', 'header', 'footer', 'aside')
 
+# Characters that are not allowed in XML 1.0 documents
+INVALID_XML_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# Link filters for the archive page
+# Individual briefing pages, not pagination: /briefings-statements/some-slug/
+BRIEFING_LINK_SELECTOR = 'a[href*="/briefings-statements/"]:not([href*="/page/"])'
+NAV_WORDS_RE = re.compile(r'next|previous|older|newer|page|»|«')
+BLOCKED_TITLES = frozenset({
+    'briefings & statements', 'briefings and statements',
+    'briefings &amp; statements', 'briefings&amp;statements'
+})
+BASE_URLS = frozenset({
+    CONFIG['base_url'] + '/briefings-statements',
+    CONFIG['base_url'] + '/briefings-statements/'
+})
+
+# Shared HTTP/2 client: concurrent fetches from the worker threads are multiplexed
+# as streams over one connection instead of opening a connection per request
+CLIENT = httpx.Client(
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+    ),
+    follow_redirects=True,
+    timeout=30,
+    headers={
+        'User-Agent': CONFIG['user_agent'],
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, br, deflate',  # br decoding needs the brotli package
+    }
+)
+
+
+@dataclass(slots=True)
+class Entry:
+    """A single briefing/statement from the archive page."""
+    title: str
+    url: str
+    date: datetime
+    date_str: str
+    content: str | None = None  # Fetched after the archive page is parsed
+
+
+@functools.lru_cache(maxsize=512)
 def parse_date(date_str: str) -> datetime:
-    """Parse date string like 'November 14, 2025' into datetime object."""
+    """Parse date string like 'November 14, 2025', 'Nov 14, 2025' or '2025-11-14' into datetime object.
+    
+    Memoized, since many entries on the archive page share the same date.
+    """
     try:
-        # Try common formats
-        for fmt in ['%B %d, %Y', '%b %d, %Y', '%Y-%m-%d']:
-            try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                return dt.replace(tzinfo=timezone.utc)
-            except ValueError:
-                continue
+        parts = date_str.strip().replace(',', ' ').split()
         
-        # If no format matched, return current time
-        logger.warning(f"Could not parse date: {date_str}")
-        return datetime.now(timezone.utc)
+        # "November 14, 2025" / "Nov 14, 2025"
+        if len(parts) == 3 and parts[0].lower() in MONTHS:
+            month_name, day, year = parts
+            return datetime(int(year), MONTHS[month_name.lower()], int(day), tzinfo=timezone.utc)
+        
+        # "2025-11-14"
+        if len(parts) == 1 and parts[0].count('-') == 2:
+            year, month, day = parts[0].split('-')
+            return datetime(int(year), int(month), int(day), tzinfo=timezone.utc)
+    except ValueError:
+        pass
     except Exception as e:
         logger.error(f"Date parsing error: {e}")
         return datetime.now(timezone.utc)
+    
+    # If no format matched, return current time
+    logger.warning(f"Could not parse date: {date_str}")
+    return datetime.now(timezone.utc)
 
 
 def fetch_page(url: str) -> str:
     """Fetch the webpage content."""
-    headers = {
-        'User-Agent': CONFIG['user_agent'],
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-    }
-    
-    response = requests.get(url, headers=headers, timeout=30)
+    response = CLIENT.get(url)
     response.raise_for_status()
     return response.text
 
 
-def extract_article_content(url: str) -> str:
-    """Fetch and extract the full text content from an article page."""
+def load_cache(path: str) -> dict:
+    """Load the article cache ({url: {'etag', 'last_modified', 'content', 'checked'}}) from disk."""
+    if not os.path.exists(path):
+        return {}
     try:
-        html = fetch_page(url)
-        soup = BeautifulSoup(html, 'html.parser')
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read cache {path}: {e}")
+        return {}
+
+
+def save_cache(cache: dict, path: str) -> None:
+    """Write the article cache to disk."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+    logger.info(f"Cache written to: {path} ({len(cache)} articles)")
+
+
+def element_text(element) -> str:
+    """Concatenate an element's stripped text fragments (stripping each text fragment)."""
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def parse_article_content(html: str) -> str:
+    """Extract the full text content from an article page's HTML."""
+    tree = lxml.html.document_fromstring(html)
+    
+    # Try to find the main content area, in order of preference; on typical
+    # pages //article matches and the remaining patterns are never evaluated
+    content = None
+    for xpath in CONTENT_XPATHS:
+        matches = xpath(tree)
+        if matches:
+            content = matches[0]
+            break
+    
+    # If no specific content area found, look for a div with a content-like class
+    if content is None:
+        content = next((div for div in tree.iter('div') if CONTENT_CLASS_RE.search(div.get('class', ''))), None)
+    
+    if content is not None:
+        # Remove script, style and page chrome elements (keeping their tail text)
+        etree.strip_elements(content, *STRIP_TAGS, with_tail=False)
         
-        # Try to find the main content area
-        # Common patterns for White House article content
-        content_selectors = [
-            'article',
-            '.entry-content',
-            '.post-content',
-            '.content',
-            'main',
-            '[role="main"]',
-            '.briefing-content',
-            '.statement-content'
-        ]
+        # Get all paragraphs, only including substantial ones
+        text_parts = [text for p in content.xpath('.//p|.//div') if len(text := element_text(p)) > 20]
         
-        content = None
-        for selector in content_selectors:
-            content = soup.select_one(selector)
-            if content:
-                break
+        if text_parts:
+            return '\n\n'.join(text_parts)
+    
+    # Fallback: get all paragraph text from body
+    body = tree.find('body')
+    if body is not None:
+        etree.strip_elements(body, *STRIP_TAGS, with_tail=False)
+        text_parts = [text for p in body.iter('p') if len(text := element_text(p)) > 20]
+        if text_parts:
+            return '\n\n'.join(text_parts)
+    
+    return ""
+
+
+def extract_article_content(url: str, cache: dict | None = None) -> str:
+    """Fetch and extract the full text content from an article page.
+    
+    If a cache is given, extracted content is stored in it along with the time it was
+    checked. For URLs already cached, a conditional GET is sent using the stored
+    ETag/Last-Modified and the cached content is reused when the server answers
+    304 Not Modified.
+    """
+    try:
+        cached = cache.get(url) if cache is not None else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         
-        # If no specific content area found, try to find paragraphs in the main area
-        if not content:
-            # Look for the main content by finding the largest text block
-            main = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile(r'content|entry|post', re.I))
-            if main:
-                content = main
+        response = CLIENT.get(url, headers=headers)
+        if response.status_code == 304 and cached:
+            cached['checked'] = int(time.time())
+            return cached['content']
+        response.raise_for_status()
         
-        if content:
-            # Remove script and style elements
-            for script in content(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                script.decompose()
-            
-            # Get all paragraphs
-            paragraphs = content.find_all(['p', 'div'])
-            text_parts = []
-            
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if text and len(text) > 20:  # Only include substantial paragraphs
-                    text_parts.append(text)
-            
-            if text_parts:
-                return '\n\n'.join(text_parts)
+        content = parse_article_content(response.text)
+        if not content:
+            logger.warning(f"Could not extract content from {url}")
+            return ""
         
-        # Fallback: get all paragraph text from body
-        body = soup.find('body')
-        if body:
-            for script in body(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                script.decompose()
-            paragraphs = body.find_all('p')
-            text_parts = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True) and len(p.get_text(strip=True)) > 20]
-            if text_parts:
-                return '\n\n'.join(text_parts)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if cache is not None:
+            cache[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content': content,
+                'checked': int(time.time())
+            }
         
-        logger.warning(f"Could not extract content from {url}")
-        return ""
+        return content
         
     except Exception as e:
         logger.error(f"Error extracting content from {url}: {e}")
         return ""
 
 
-def extract_entries(html: str) -> list[dict]:
+def find_nearby_date(link, date_cache: dict, max_depth: int = 5) -> str | None:
+    """Find the first date string in the closest of a link's ancestors (up to max_depth levels).
+    
+    Links in the same listing share ancestors, so the date found in each ancestor's
+    text is memoized in date_cache (keyed by node) and every ancestor is searched
+    at most once per page. Script and style elements must already be stripped from
+    the tree, otherwise their source counts as text.
+    """
+    node = link.parent
+    
+    for _ in range(max_depth):
+        if node is None:
+            break
+        
+        if node.mem_id not in date_cache:
+            date_match = DATE_RE.search(node.text())
+            date_cache[node.mem_id] = date_match.group(0) if date_match else None
+        if date_cache[node.mem_id]:
+            return date_cache[node.mem_id]
+        
+        node = node.parent
+    
+    return None
+
+
+def extract_entries(html: str) -> list[Entry]:
     """Extract briefing entries from the HTML."""
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = LexborHTMLParser(html)
+    # Script/style source must not be searched for dates (node.text() would include it)
+    tree.strip_tags(['script', 'style'])
+    
+    # The listing and its dates live in <main>; fall back to the whole page without it
+    main = tree.css_first('main')
+    links = main.css(BRIEFING_LINK_SELECTOR) if main is not None else []
+    if not links:
+        links = tree.css(BRIEFING_LINK_SELECTOR)
     entries = []
     
     # Strategy 1: Look for links containing '/briefings-statements/' in href
     # that appear to be article titles (not navigation)
     seen_urls = set()
+    date_cache = {}
     
-    for link in soup.find_all('a', href=True):
-        href = link.get('href', '')
+    for link in links:
+        href = link.attributes['href']
+        
+        # Normalize URL
+        if href.startswith('/'):
+            full_url = CONFIG['base_url'] + href
+        else:
+            full_url = href
         
-        # Skip navigation and non-article links
-        if not href:
+        # Skip the main briefings-statements page (with or without trailing slash)
+        if full_url.rstrip('/') in BASE_URLS:
             continue
         
-        # We want individual briefing pages, not the archive page itself
-        # Pattern: /briefings-statements/some-slug/
-        if '/briefings-statements/' in href:
-            # Normalize URL
-            if href.startswith('/'):
-                full_url = CONFIG['base_url'] + href
-            else:
-                full_url = href
-            
-            # Skip the main briefings-statements page (with or without trailing slash)
-            base_briefings_url = CONFIG['base_url'] + '/briefings-statements'
-            if full_url.rstrip('/') == base_briefings_url.rstrip('/'):
-                continue
-            
-            # Skip if we've seen this URL
-            if full_url in seen_urls:
-                continue
-            
-            # Skip pagination links
-            if '/page/' in href:
-                continue
-                
-            # Get title text early to filter out unwanted entries
-            title = link.get_text(strip=True)
-            
-            # Skip "Briefings & Statements" or "Briefings and Statements" title FIRST
-            # This catches the main page link regardless of URL format
-            title_lower = title.lower().strip()
-            if title_lower in ['briefings & statements', 'briefings and statements', 
-                              'briefings &amp; statements', 'briefings&amp;statements']:
-                continue
-            
-            # Skip empty titles or very short ones (likely not articles)
-            if not title or len(title) < 10:
-                continue
-            
-            # Skip if title looks like navigation
-            nav_words = ['next', 'previous', 'older', 'newer', 'page', '»', '«']
-            if any(word in title.lower() for word in nav_words):
-                continue
-            
-            # Also skip if URL is the base page (double check)
-            if full_url.rstrip('/') in [CONFIG['base_url'] + '/briefings-statements', 
-                                       CONFIG['base_url'] + '/briefings-statements/']:
-                continue
-            
-            seen_urls.add(full_url)
-            
-            # Try to find associated date
-            # Look in parent elements for date patterns
-            date_str = None
-            parent = link.parent
-            
-            # Search up to 5 levels up for a date
-            for _ in range(5):
-                if parent is None:
-                    break
-                
-                parent_text = parent.get_text()
-                
-                # Look for date pattern like "November 14, 2025"
-                date_match = re.search(
-                    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},\s+\d{4}',
-                    parent_text
-                )
-                if date_match:
-                    date_str = date_match.group(0)
-                    break
-                
-                parent = parent.parent
-            
-            entry = {
-                'title': title,
-                'url': full_url,
-                'date': parse_date(date_str) if date_str else datetime.now(timezone.utc),
-                'date_str': date_str or 'Unknown',
-                'content': None  # Will be fetched later
-            }
-            entries.append(entry)
-            logger.info(f"Found: {title[:60]}... ({entry['date_str']})")
+        # Skip if we've seen this URL
+        if full_url in seen_urls:
+            continue
+        
+        # Get title text early to filter out unwanted entries
+        title = link.text(strip=True)
+        
+        # Skip "Briefings & Statements" or "Briefings and Statements" title FIRST
+        # This catches the main page link regardless of URL format
+        title_lower = title.lower().strip()
+        if title_lower in BLOCKED_TITLES:
+            continue
+        
+        # Skip empty titles or very short ones (likely not articles)
+        if not title or len(title) < 10:
+            continue
+        
+        # Skip if title looks like navigation
+        if NAV_WORDS_RE.search(title_lower):
+            continue
+        
+        seen_urls.add(full_url)
+        
+        # Try to find associated date in parent elements
+        date_str = find_nearby_date(link, date_cache)
+        
+        entry = Entry(
+            title=title,
+            url=full_url,
+            date=parse_date(date_str) if date_str else datetime.now(timezone.utc),
+            date_str=date_str or 'Unknown'
+        )
+        entries.append(entry)
+        logger.info(f"Found: {title[:60]}... ({entry.date_str})")
     
     # Sort by date, newest first
-    entries.sort(key=lambda x: x['date'], reverse=True)
+    entries.sort(key=attrgetter('date'), reverse=True)
     
     return entries
 
 
-def generate_rss(entries: list[dict], output_path: str) -> None:
-    """Generate RSS feed from entries."""
-    fg = FeedGenerator()
-    fg.title(CONFIG['feed_title'])
-    fg.link(href=CONFIG['url'], rel='alternate')
-    fg.link(href=output_path, rel='self')
-    fg.description(CONFIG['feed_description'])
-    fg.language('en')
-    fg.lastBuildDate(datetime.now(timezone.utc))
-    
-    # Add logo/image to the feed
-    fg.image(
-        url=CONFIG['logo_url'],
-        title=CONFIG['logo_title'],
-        link=CONFIG['logo_link'],
-        width=str(CONFIG['logo_width']),
-        height=str(CONFIG['logo_height'])
-    )
+def generate_rss(entries: list[Entry], output_path: str) -> None:
+    """Generate RSS feed from entries, writing the XML directly to the output file."""
+    def text(value: str) -> str:
+        return escape(INVALID_XML_CHARS_RE.sub('', value))
     
-    for entry in entries:
-        fe = fg.add_entry()
-        fe.title(entry['title'])
-        fe.link(href=entry['url'])
-        fe.guid(entry['url'], permalink=True)
-        fe.pubDate(entry['date'])
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write("<?xml version='1.0' encoding='UTF-8'?>\n")
+        f.write('<rss xmlns:atom="http://www.w3.org/2005/Atom" '
+                'xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">\n')
+        f.write('  <channel>\n')
+        f.write(f'    <title>{text(CONFIG["feed_title"])}</title>\n')
+        f.write(f'    <link>{text(CONFIG["url"])}</link>\n')
+        f.write(f'    <description>{text(CONFIG["feed_description"])}</description>\n')
+        f.write(f'    <atom:link href={quoteattr(output_path)} rel="self"/>\n')
+        f.write('    <docs>http://www.rssboard.org/rss-specification</docs>\n')
         
-        # Use full content if available, otherwise fall back to title
-        if entry.get('content') and entry['content'].strip():
-            # Clean up the content and limit length for RSS (some readers have limits)
-            content = entry['content'].strip()
-            # Limit to ~5000 characters to avoid issues with RSS readers
-            if len(content) > 5000:
-                content = content[:5000] + "..."
-            fe.description(content)
-        else:
-            fe.description(f"White House Briefing/Statement: {entry['title']}")
+        # Add logo/image to the feed
+        f.write('    <image>\n')
+        f.write(f'      <url>{text(CONFIG["logo_url"])}</url>\n')
+        f.write(f'      <title>{text(CONFIG["logo_title"])}</title>\n')
+        f.write(f'      <link>{text(CONFIG["logo_link"])}</link>\n')
+        f.write(f'      <width>{CONFIG["logo_width"]}</width>\n')
+        f.write(f'      <height>{CONFIG["logo_height"]}</height>\n')
+        f.write('    </image>\n')
+        f.write('    <language>en</language>\n')
+        f.write(f'    <lastBuildDate>{format_datetime(datetime.now(timezone.utc))}</lastBuildDate>\n')
+        
+        for entry in entries:
+            # Use full content if available, otherwise fall back to title
+            if entry.content and entry.content.strip():
+                # Clean up the content and limit length for RSS (some readers have limits)
+                content = entry.content.strip()
+                # Limit to ~5000 characters to avoid issues with RSS readers
+                if len(content) > 5000:
+                    content = content[:5000] + "..."
+                description = content
+            else:
+                description = f"White House Briefing/Statement: {entry.title}"
+            
+            f.write('    <item>\n')
+            f.write(f'      <title>{text(entry.title)}</title>\n')
+            f.write(f'      <link>{text(entry.url)}</link>\n')
+            f.write(f'      <description>{text(description)}</description>\n')
+            f.write(f'      <guid isPermaLink="true">{text(entry.url)}</guid>\n')
+            f.write(f'      <pubDate>{format_datetime(entry.date)}</pubDate>\n')
+            f.write('    </item>\n')
+        
+        f.write('  </channel>\n')
+        f.write('</rss>\n')
     
-    # Write RSS file
-    fg.rss_file(output_path, pretty=True)
     logger.info(f"RSS feed written to: {output_path}")
 
 
@@ -302,21 +442,45 @@ def main():
         
         # Fetch full content for each entry
         if entries:
-            logger.info("Fetching article content...")
-            for i, entry in enumerate(entries, 1):
-                logger.info(f"Fetching content for entry {i}/{len(entries)}: {entry['title'][:50]}...")
-                entry['content'] = extract_article_content(entry['url'])
-                if entry['content']:
-                    logger.info(f"  Extracted {len(entry['content'])} characters")
+            # Published briefings rarely change, so cached entries are only re-checked
+            # (with a conditional GET) once they are older than revalidate_after_days
+            cache = load_cache(CONFIG['cache_file'])
+            stale_before = time.time() - CONFIG['revalidate_after_days'] * 86400
+            to_fetch = []
+            for entry in entries:
+                cached = cache.get(entry.url)
+                if cached:
+                    entry.content = cached['content']
+                if not cached or cached.get('checked', 0) < stale_before:
+                    to_fetch.append(entry)
+            logger.info(f"Reusing cached content for {len(entries) - len(to_fetch)} entries")
+            
+            logger.info(f"Fetching article content for {len(to_fetch)} new or stale entries ({CONFIG['max_workers']} workers)...")
+            with ThreadPoolExecutor(max_workers=CONFIG['max_workers']) as executor:
+                contents = list(executor.map(
+                    lambda url: extract_article_content(url, cache),
+                    [entry.url for entry in to_fetch]
+                ))
+            
+            for i, (entry, content) in enumerate(zip(to_fetch, contents), 1):
+                if content:
+                    entry.content = content
+                    logger.info(f"Entry {i}/{len(to_fetch)}: extracted {len(content)} characters from {entry.title[:50]}...")
+                elif entry.content:
+                    logger.warning(f"Entry {i}/{len(to_fetch)}: re-check failed, keeping cached content for {entry.title[:50]}...")
                 else:
-                    logger.warning(f"  No content extracted")
+                    logger.warning(f"Entry {i}/{len(to_fetch)}: no content extracted from {entry.title[:50]}...")
+            
+            # Only keep articles still listed on the archive page
+            current_urls = {entry.url for entry in entries}
+            save_cache({url: item for url, item in cache.items() if url in current_urls}, CONFIG['cache_file'])
             
             generate_rss(entries, CONFIG['output_file'])
             logger.info("Done!")
         else:
             logger.warning("No entries found. The page structure may have changed.")
             
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Failed to fetch page: {e}")
         raise
     except Exception as e: